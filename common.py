@@ -15,7 +15,6 @@ __docformat__ = "markdown en"
 # so don't import anything from calibre_plugins
 
 import os
-import re
 import sys
 import time
 import traceback
@@ -51,7 +50,6 @@ except ImportError:
     # which does not define 'unicode'.
     unicode_type = unicode  # noqa: F821
 
-kobo_js_re = re.compile(r".*/?kobo.*\.js$", re.IGNORECASE)
 XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
 configdir = os.path.join(config_dir, "plugins")  # type: str
 reference_kepub = os.path.join(configdir, "reference.kepub.epub")  # type: str
@@ -121,6 +119,12 @@ class Logger:
 log = Logger()
 
 
+def is_kobo_js(name):  # type: (str) -> bool
+    """Determine if a container file name refers to a Kobo JavaScript file."""
+    name = name.lower()
+    return name.endswith(".js") and "kobo" in name
+
+
 # The logic here to detect a cover image is mostly duplicated from
 # metadata/writer.py. Updates to the logic here probably need an accompanying
 # update over there.
@@ -258,7 +262,7 @@ def modify_epub(
         # Check to see if there's already a kobo*.js in the ePub
         skip_js = False  # type: str
         for name in container.name_path_map:
-            if kobo_js_re.match(name):
+            if is_kobo_js(name):
                 skip_js = True
                 break
 
@@ -266,7 +270,7 @@ def modify_epub(
             if os.path.isfile(reference_kepub):
                 reference_container = EpubContainer(reference_kepub, log)
                 for name in reference_container.name_path_map:
-                    if kobo_js_re.match(name):
+                    if is_kobo_js(name):
                         jsname = container.copy_file_to_container(
                             os.path.join(reference_container.root, name), name="kobo.js"
                         )
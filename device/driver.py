@@ -11,17 +11,17 @@ __license__ = "GPL v3"
 __copyright__ = "2013, Joel Goguen <jgoguen@jgoguen.ca>"
 __docformat__ = "markdown en"
 
+import codecs
 import json
 import os
-import re
 import shutil
 from datetime import datetime
 
 try:
     # Python 3
-    from configparser import SafeConfigParser
+    from configparser import ConfigParser
 except ImportError:
-    from ConfigParser import SafeConfigParser
+    from ConfigParser import SafeConfigParser as ConfigParser
 
 from calibre.constants import config_dir
 from calibre.devices.kobo.driver import KOBOTOUCH
@@ -41,6 +41,42 @@ except NameError:
 
 EPUB_EXT = ".epub"
 KEPUB_EXT = ".kepub"
+_EPUB_EXT_LEN = len(EPUB_EXT)
+_KEPUB_EPUB = KEPUB_EXT + EPUB_EXT
+
+# Driver options and their default values
+_OPTS = (
+    ("extra_features", True),
+    ("upload_encumbered", False),
+    ("skip_failed", False),
+    ("hyphenate", False),
+    ("smarten_punctuation", False),
+    ("clean_markup", False),
+    ("full_page_numbers", False),
+    ("disable_hyphenation", False),
+    ("file_copy_dir", ""),
+)
+
+
+def _str_or_none(value):
+    return value if isinstance(value, str) else None
+
+
+# Options formerly stored in extra_customization, as (name, index, validator)
+_MIGRATION_TABLE = (
+    ("extra_features", 0, None),
+    ("upload_encumbered", 1, None),
+    ("skip_failed", 2, None),
+    ("hyphenate", 3, None),
+    ("smarten_punctuation", 4, None),
+    ("clean_markup", 5, None),
+    ("full_page_numbers", 6, None),
+    ("file_copy_dir", 7, _str_or_none),
+    ("disable_hyphenation", 8, None),
+)
+# disable_hyphenation was added without raising the number of options old
+# settings had to contain to be migrated, so one fewer than the table is enough
+_MIGRATION_MIN_OPTIONS = 8
 
 
 class InvalidEPub(ValueError):
@@ -94,15 +130,41 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
     EXTRA_CUSTOMIZATION_MESSAGE = KOBOTOUCH.EXTRA_CUSTOMIZATION_MESSAGE[:]
     EXTRA_CUSTOMIZATION_DEFAULT = KOBOTOUCH.EXTRA_CUSTOMIZATION_DEFAULT[:]
 
-    skip_renaming_files = set([])
-    kobo_js_re = re.compile(r".*/?kobo.*\.js$", re.IGNORECASE)
-    invalid_filename_chars_re = re.compile(
-        r"[\/\\\?%\*:;\|\"\'><\$!]", re.IGNORECASE | re.UNICODE
+    skip_renaming_files = set()
+    _cached_settings = None
+    _cached_settings_mtime = None
+    _settings_file_path = None
+    _pref_cache = None
+    _version_str = None
+    _driveinfo_base = None
+    _in_upload = False
+    # Map each character not allowed in a file name to an underscore
+    _INVALID_CHARS_TABLE = {ord(c): "_" for c in "/\\?%*:;|\"'><$!"}
+    # Device detection methods and the CSS file to use for each, in order
+    _DEVICE_CSS_FILES = (
+        ("isAuraH2O", "kobo_extra_AURAH2O.css"),
+        ("isAuraHD", "kobo_extra_AURAHD.css"),
+        ("isAura", "kobo_extra_AURA.css"),
+        ("isGlo", "kobo_extra_GLO.css"),
+        ("isGloHD", "kobo_extra_GLOHD.css"),
+        ("isMini", "kobo_extra_MINI.css"),
+        ("isTouch", "kobo_extra_TOUCH.css"),
     )
 
+    def _cached_pref(self, key):
+        """Get a preference, memoized for the duration of an upload."""
+        if self._pref_cache is None:
+            return self.get_pref(key)
+        if key not in self._pref_cache:
+            self._pref_cache[key] = self.get_pref(key)
+        return self._pref_cache[key]
+
     def modifying_epub(self):
         """Determine if this epub will be modified."""
-        return (
+        if self._pref_cache is not None and "__modifying_epub__" in self._pref_cache:
+            return self._pref_cache["__modifying_epub__"]
+
+        modifying = (
             self.modifying_css()
             or self.clean_markup
             or self.extra_features
@@ -110,19 +172,39 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
             or self.smarten_punctuation
             or self.disable_hyphenation
         )
+        if self._pref_cache is not None:
+            self._pref_cache["__modifying_epub__"] = modifying
+        return modifying
+
+    @classmethod
+    def _get_version_str(cls):
+        """Get the driver version as a dotted string."""
+        if cls._version_str is None:
+            cls._version_str = ".".join(map(str, cls.version))
+        return cls._version_str
+
+    @classmethod
+    def _settings_file_mtime(cls):
+        """Get the modification time of the driver preferences file, if any."""
+        if cls._settings_file_path is None:
+            cls._settings_file_path = cls._config().config_file_path
+        try:
+            return os.path.getmtime(cls._settings_file_path)
+        except OSError:
+            return None
 
     @classmethod
     def settings(cls):
         """Initialize settings for the driver."""
+        mtime = cls._settings_file_mtime()
+        if cls._cached_settings is not None and mtime == cls._cached_settings_mtime:
+            return cls._cached_settings
+
         opts = super(KOBOTOUCHEXTENDED, cls).settings()
         log.debug("KoboTouchExtended:settings: settings=", opts)
-        # Make sure that each option is actually the right type
-        for idx in range(0, len(cls.EXTRA_CUSTOMIZATION_DEFAULT)):
-            if not isinstance(
-                opts.extra_customization[idx],
-                type(cls.EXTRA_CUSTOMIZATION_DEFAULT[idx]),
-            ):
-                opts.extra_customization[idx] = cls.EXTRA_CUSTOMIZATION_DEFAULT[idx]
+
+        cls._cached_settings = opts
+        cls._cached_settings_mtime = mtime
         return opts
 
     @classmethod
@@ -177,6 +259,41 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
             log.info("KoboTouchExtended:save_settings: Have new style config.")
 
         super(KOBOTOUCHEXTENDED, cls).save_settings(config_widget)
+        cls._cached_settings = None
+
+    def _read_driveinfo(self):
+        """Read calibre's device details, once per upload."""
+        if self._driveinfo_base is not None:
+            return self._driveinfo_base
+
+        calibre_details_file = self.normalize_path(
+            os.path.join(self._main_prefix, "driveinfo.calibre")
+        )
+        log.debug(
+            "KoboTouchExtended:_read_driveinfo:Calibre details file :: "
+            "{0}".format(calibre_details_file)
+        )
+        o = {}
+        if os.path.isfile(calibre_details_file):
+            with open(calibre_details_file, "rb") as f:
+                o = json.loads(f.read())
+            for prop in (
+                "device_store_uuid",
+                "prefix",
+                "last_library_uuid",
+                "location_code",
+            ):
+                del o[prop]
+        else:
+            log.warning(
+                "KoboTouchExtended:_read_driveinfo:Calibre details file does "
+                "not exist!"
+            )
+
+        if self._in_upload:
+            # Only keep the details for the duration of an upload
+            self._driveinfo_base = o
+        return o
 
     def _modify_epub(self, infile, metadata, container=None):
         if not infile.endswith(EPUB_EXT):
@@ -192,9 +309,10 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
                 infile, metadata, container
             )
 
+        authors = " and ".join(metadata.authors)
         log.info(
             "KoboTouchExtended:_modify_epub:Adding basic Kobo features to "
-            "{0} by {1}".format(metadata.title, " and ".join(metadata.authors))
+            "{0} by {1}".format(metadata.title, authors)
         )
 
         opts = self.settings()
@@ -233,39 +351,17 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
 
         try:
             # Add the conversion info file
-            calibre_details_file = self.normalize_path(
-                os.path.join(self._main_prefix, "driveinfo.calibre")
-            )
-            log.debug(
-                "KoboTouchExtended:_modify_epub:Calibre details file :: "
-                "{0}".format(calibre_details_file)
-            )
-            o = {}
-            if os.path.isfile(calibre_details_file):
-                with open(calibre_details_file, "rb") as f:
-                    o = json.loads(f.read())
-                for prop in (
-                    "device_store_uuid",
-                    "prefix",
-                    "last_library_uuid",
-                    "location_code",
-                ):
-                    del o[prop]
-            else:
-                log.warning(
-                    "KoboTouchExtended:_modify_file:Calibre details file does "
-                    "not exist!"
-                )
-            o["kobotouchextended_version"] = ".".join([str(n) for n in self.version])
+            o = dict(self._read_driveinfo())
+            o["kobotouchextended_version"] = self._get_version_str()
             o["kobotouchextended_options"] = str(opts.extra_customization)
-            o["kobotouchextended_currenttime"] = datetime.utcnow().ctime()
+            o["kobotouchextended_currenttime"] = datetime.utcnow().isoformat()
             kte_data_file = self.temporary_file("_KoboTouchExtendedDriverInfo")
             log.debug(
                 "KoboTouchExtended:_modify_epub:Driver data file :: {0}".format(
                     kte_data_file.name
                 )
             )
-            kte_data_file.write(json.dumps(o).encode("UTF-8"))
+            json.dump(o, codecs.getwriter("UTF-8")(kte_data_file))
             kte_data_file.close()
             container.copy_file_to_container(
                 kte_data_file.name, name="driverinfo.kte", mt="application/json"
@@ -286,7 +382,7 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
         except Exception as e:
             log.exception(
                 "Failed to process {0} by {1}: {2}".format(
-                    metadata.title, " and ".join(metadata.authors), e.message,
+                    metadata.title, authors, e.message,
                 )
             )
 
@@ -309,7 +405,7 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
                 "KoboTouchExtended:_modify_epub:Generated KePub file copy "
                 "path: {0}".format(dpath)
             )
-            shutil.copy(infile, dpath)
+            shutil.copyfile(infile, dpath)
 
         retval = super(KOBOTOUCHEXTENDED, self)._modify_epub(
             infile, metadata, container
@@ -318,42 +414,67 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
             container.commit(outpath=infile)
         return retval
 
-    def upload_books(self, files, names, on_card=None, end_session=True, metadata=None):
-        """Process sending the book to the Kobo device."""
-        if self.modifying_css():
-            log.info(
-                "KoboTouchExtended:upload_books:Searching for device-specific "
-                "CSS file"
-            )
+    def open(self, connected_device, library_uuid):
+        """Open the device, forgetting anything cached for a previous device."""
+        self.__dict__.pop("_device_css_name", None)
+        self.__dict__.pop("_device_css_file_exists", None)
+        super(KOBOTOUCHEXTENDED, self).open(connected_device, library_uuid)
+
+    @property
+    def _device_css_name(self):
+        """Get the name of the CSS file specific to the connected device."""
+        if "_device_css_name" not in self.__dict__:
             device_css_file_name = self.KOBO_EXTRA_CSSFILE
             try:
-                if self.isAuraH2O():
-                    device_css_file_name = "kobo_extra_AURAH2O.css"
-                elif self.isAuraHD():
-                    device_css_file_name = "kobo_extra_AURAHD.css"
-                elif self.isAura():
-                    device_css_file_name = "kobo_extra_AURA.css"
-                elif self.isGlo():
-                    device_css_file_name = "kobo_extra_GLO.css"
-                elif self.isGloHD():
-                    device_css_file_name = "kobo_extra_GLOHD.css"
-                elif self.isMini():
-                    device_css_file_name = "kobo_extra_MINI.css"
-                elif self.isTouch():
-                    device_css_file_name = "kobo_extra_TOUCH.css"
+                for predicate, css_file_name in self._DEVICE_CSS_FILES:
+                    if getattr(self, predicate)():
+                        device_css_file_name = css_file_name
+                        break
             except AttributeError:
                 log.warning(
-                    "KoboTouchExtended:upload_books:Calibre version too old "
+                    "KoboTouchExtended:_device_css_name:Calibre version too old "
                     "to handle some specific devices, falling back to "
                     "generic file {0}".format(device_css_file_name)
                 )
-            device_css_file_name = os.path.join(self.configdir, device_css_file_name)
-            if os.path.isfile(device_css_file_name):
+            self.__dict__["_device_css_name"] = device_css_file_name
+        return self.__dict__["_device_css_name"]
+
+    @property
+    def _device_css_file_exists(self):
+        """Determine if the device-specific CSS file exists."""
+        if "_device_css_file_exists" not in self.__dict__:
+            self.__dict__["_device_css_file_exists"] = os.path.isfile(
+                os.path.join(self.configdir, self._device_css_name)
+            )
+        return self.__dict__["_device_css_file_exists"]
+
+    def upload_books(self, files, names, on_card=None, end_session=True, metadata=None):
+        """Process sending the book to the Kobo device."""
+        # _modify_epub() repopulates this for every book in the batch before
+        # filename_callback() is consulted, so nothing from earlier uploads applies
+        self.skip_renaming_files.clear()
+        self._pref_cache = {}
+        self._in_upload = True
+        try:
+            return self._upload_books(files, names, on_card, end_session, metadata)
+        finally:
+            self._in_upload = False
+            self._pref_cache = None
+            self._driveinfo_base = None
+
+    def _upload_books(self, files, names, on_card, end_session, metadata):
+        if self.modifying_css():
+            log.info(
+                "KoboTouchExtended:upload_books:Searching for device-specific "
+                "CSS file"
+            )
+            device_css_file_name = os.path.join(self.configdir, self._device_css_name)
+            if self._device_css_file_exists:
                 log.info(
                     "KoboTouchExtended:upload_books:Found device-specific "
                     "file {0}".format(device_css_file_name)
                 )
-                shutil.copy(
+                shutil.copyfile(
                     device_css_file_name,
                     os.path.join(self._main_prefix, self.KOBO_EXTRA_CSSFILE),
                 )
@@ -367,25 +488,27 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
             self._main_prefix, ".kobo", "Kobo", "Kobo eReader.conf"
         )
         if os.path.isfile(kobo_config_file):
-            cfg = SafeConfigParser(allow_no_value=True)
+            cfg = ConfigParser(allow_no_value=True)
             cfg.optionxform = str
             cfg.read(kobo_config_file)
 
-            if not cfg.has_section("FeatureSettings"):
-                cfg.add_section("FeatureSettings")
-            log.info(
-                "KoboTouchExtended:upload_books:Setting FeatureSettings."
-                "FullBookPageNumbers to {0}".format(
-                    "true" if self.full_page_numbers else "false"
+            full_page_numbers = "true" if self.full_page_numbers else "false"
+            current_full_page_numbers = None
+            if cfg.has_option("FeatureSettings", "FullBookPageNumbers"):
+                current_full_page_numbers = cfg.get(
+                    "FeatureSettings", "FullBookPageNumbers", raw=True
                 )
-            )
-            cfg.set(
-                "FeatureSettings",
-                "FullBookPageNumbers",
-                "true" if self.full_page_numbers else "false",
-            )
-            with open(kobo_config_file, "w") as cfgfile:
-                cfg.write(cfgfile)
+
+            if current_full_page_numbers != full_page_numbers:
+                if not cfg.has_section("FeatureSettings"):
+                    cfg.add_section("FeatureSettings")
+                log.info(
+                    "KoboTouchExtended:upload_books:Setting FeatureSettings."
+                    "FullBookPageNumbers to {0}".format(full_page_numbers)
+                )
+                cfg.set("FeatureSettings", "FullBookPageNumbers", full_page_numbers)
+                with open(kobo_config_file, "w") as cfgfile:
+                    cfg.write(cfgfile)
 
         return super(KOBOTOUCHEXTENDED, self).upload_books(
             files, names, on_card, end_session, metadata
@@ -395,17 +518,23 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
         """Ensure the filename on the device is correct."""
         if self.extra_features:
             log.debug("KoboTouchExtended:filename_callback:Path - {0}".format(path))
-            if path.endswith(KEPUB_EXT):
-                path += EPUB_EXT
-            elif path.endswith(EPUB_EXT) and mi.uuid not in self.skip_renaming_files:
-                path = path[: -len(EPUB_EXT)] + KEPUB_EXT + EPUB_EXT
+            # Paths already ending in .kepub.epub are left alone; they used to be
+            # renamed a second time to .kepub.kepub.epub
+            if not path.endswith(_KEPUB_EPUB):
+                if path.endswith(KEPUB_EXT):
+                    path += EPUB_EXT
+                elif (
+                    path.endswith(EPUB_EXT)
+                    and mi.uuid not in self.skip_renaming_files
+                ):
+                    path = path[:-_EPUB_EXT_LEN] + _KEPUB_EPUB
 
             log.debug("KoboTouchExtended:filename_callback:New path - {0}".format(path))
         return path
 
     def sanitize_path_components(self, components):
         """Perform any sanitization of path components."""
-        return [self.invalid_filename_chars_re.sub("_", x) for x in components]
+        return [x.translate(self._INVALID_CHARS_TABLE) for x in components]
 
     def sync_booklists(self, booklists, end_session=True):
         """Synchronize book lists between calibre and the Kobo device."""
@@ -426,44 +555,51 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
                 db = apsw.Connection(self.device_database_path())
 
             def __rows_needing_imageid():
-                """Map row ContentID entries needing an ImageID.
+                """Find row ContentID entries needing an ImageID.
 
-                Returns a dict object with keys being the ContentID of a row
-                without an ImageID.
+                Returns a set of the ContentID of each row without an ImageID.
                 """
                 c = db.cursor()
-                d = {}
+                d = set()
                 log.debug(
                     "KoboTouchExtended:sync_booklists:About to call query: "
                     "{0}".format(select_query)
                 )
                 c.execute(select_query, (self.content_types["main"],))
                 for row in c:
-                    d[row[0]] = 1
+                    d.add(row[0])
                 return d
 
             all_nulls = __rows_needing_imageid()
             log.debug(
                 "KoboTouchExtended:sync_booklists:Got {0:d} rows to "
-                "update".format(len(list(all_nulls.keys())))
+                "update".format(len(all_nulls))
             )
             nulls = []
+            iid_cache = {}
             for booklist in booklists:
                 for b in booklist:
                     if b.application_id is not None and b.contentID in all_nulls:
-                        nulls.append(
-                            (self.imageid_from_contentid(b.contentID), b.contentID)
-                        )
-            del all_nulls
+                        iid = iid_cache.get(b.contentID)
+                        if iid is None:
+                            iid = self.imageid_from_contentid(b.contentID)
+                            iid_cache[b.contentID] = iid
+                        nulls.append((iid, b.contentID))
+            del all_nulls, iid_cache
 
             cursor = db.cursor()
-            while nulls[:100]:
+            cursor.execute("BEGIN")
+            try:
                 log.debug(
                     "KoboTouchExtended:sync_booklists:Updating {0:d} "
-                    "ImageIDs...".format(len(nulls[:100]))
+                    "ImageIDs...".format(len(nulls))
                 )
-                cursor.executemany(update_query, nulls[:100])
-                del nulls[:100]
+                cursor.executemany(update_query, nulls)
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            else:
+                cursor.execute("COMMIT")
             cursor.close()
             db.close()
             log.debug("KoboTouchExtended:sync_booklists:done setting ImageId fields")
@@ -474,15 +610,8 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
     def _config(cls):
         c = super(KOBOTOUCHEXTENDED, cls)._config()
 
-        c.add_opt("extra_features", default=True)
-        c.add_opt("upload_encumbered", default=False)
-        c.add_opt("skip_failed", default=False)
-        c.add_opt("hyphenate", default=False)
-        c.add_opt("smarten_punctuation", default=False)
-        c.add_opt("clean_markup", default=False)
-        c.add_opt("full_page_numbers", default=False)
-        c.add_opt("disable_hyphenation", default=False)
-        c.add_opt("file_copy_dir", default="")
+        for name, default in _OPTS:
+            c.add_opt(name, default=default)
 
         # remove_opt verifies the preference is present first
         c.remove_opt("replace_lang")
@@ -499,130 +628,76 @@ class KOBOTOUCHEXTENDED(KOBOTOUCH):
             settings.extra_customization,
         )
 
-        count_options = 0
-        opt_extra_features = count_options
-        count_options += 1
-        opt_upload_encumbered = count_options
-        count_options += 1
-        opt_skip_failed = count_options
-        count_options += 1
-        opt_hypnenate = count_options
-        count_options += 1
-        opt_smarten_punctuation = count_options
-        count_options += 1
-        opt_clean_markup = count_options
-        count_options += 1
-        opt_full_page_numbers = count_options
-        count_options += 1
-        opt_file_copy_dir = count_options
-        count_options += 1
-        opt_disable_hyphenation = count_options
-
-        if len(settings.extra_customization) >= count_options:
+        ec = settings.extra_customization
+        n = len(ec)
+        if n >= _MIGRATION_MIN_OPTIONS:
             log.warning(
                 "KoboTouchExtended::migrate_old_settings - settings need to "
                 "be migrated"
             )
-            try:
-                settings.extra_features = settings.extra_customization[
-                    opt_extra_features
-                ]
-            except IndexError:
-                pass
-            try:
-                settings.upload_encumbered = settings.extra_customization[
-                    opt_upload_encumbered
-                ]
-            except IndexError:
-                pass
-            try:
-                settings.skip_failed = settings.extra_customization[opt_skip_failed]
-            except IndexError:
-                pass
-            try:
-                settings.hyphenate = settings.extra_customization[opt_hypnenate]
-            except IndexError:
-                pass
-            try:
-                settings.smarten_punctuation = settings.extra_customization[
-                    opt_smarten_punctuation
-                ]
-            except IndexError:
-                pass
-            try:
-                settings.clean_markup = settings.extra_customization[opt_clean_markup]
-            except IndexError:
-                pass
-            try:
-                settings.file_copy_dir = settings.extra_customization[opt_file_copy_dir]
-                if not isinstance(settings.file_copy_dir, str):
-                    settings.file_copy_dir = None
-            except IndexError:
-                pass
-            try:
-                settings.full_page_numbers = settings.extra_customization[
-                    opt_full_page_numbers
-                ]
-            except IndexError:
-                pass
-            try:
-                settings.disable_hyphenation = settings.extra_customization[
-                    opt_disable_hyphenation
-                ]
-            except IndexError:
-                pass
-
-            settings.extra_customization = settings.extra_customization[
-                count_options + 1 :  # noqa:E203 - thanks Black formatting!
-            ]
+            for name, idx, validator in _MIGRATION_TABLE:
+                if idx < n:
+                    value = ec[idx]
+                    if validator is not None:
+                        value = validator(value)
+                    setattr(settings, name, value)
+
+            # Every migrated option is dropped, even if the list was one short
+            settings.extra_customization = ec[len(_MIGRATION_TABLE) :]  # noqa:E203
             log.info(
                 "KoboTouchExtended::migrate_old_settings - end",
                 settings.extra_customization,
             )
 
+        # Make sure that each option is actually the right type
+        ec = settings.extra_customization
+        for idx, default in enumerate(cls.EXTRA_CUSTOMIZATION_DEFAULT):
+            if idx < len(ec) and not isinstance(ec[idx], type(default)):
+                ec[idx] = default
+
         return settings
 
     @property
     def extra_features(self):
         """Determine if extra Kobo features are being applied."""
-        return self.get_pref("extra_features")
+        return self._cached_pref("extra_features")
 
     @property
     def upload_encumbered(self):
         """Determine if DRM-encumbered files will be uploaded."""
-        return self.get_pref("upload_encumbered")
+        return self._cached_pref("upload_encumbered")
 
     @property
     def skip_failed(self):
         """Determine if failed conversions will be skipped."""
-        return self.get_pref("skip_failed")
+        return self._cached_pref("skip_failed")
 
     @property
     def hyphenate(self):
         """Determine if hyphenation will be enabled."""
-        return self.get_pref("hyphenate")
+        return self._cached_pref("hyphenate")
 
     @property
     def smarten_punctuation(self):
         """Determine if punctuation will be made into smart punctuation."""
-        return self.get_pref("smarten_punctuation")
+        return self._cached_pref("smarten_punctuation")
 
     @property
     def clean_markup(self):
         """Determine if additional cleanup will be done on the book contents."""
-        return self.get_pref("clean_markup")
+        return self._cached_pref("clean_markup")
 
     @property
     def full_page_numbers(self):
         """Determine if the device should display book page numbers."""
-        return self.get_pref("full_page_numbers")
+        return self._cached_pref("full_page_numbers")
 
     @property
     def disable_hyphenation(self):
         """Determine if hyphenation should be disabled."""
-        return self.get_pref("disable_hyphenation")
+        return self._cached_pref("disable_hyphenation")
 
     @property
     def file_copy_dir(self):
         """Determine where to copy converted books to."""
-        return self.get_pref("file_copy_dir")
+        return self._cached_pref("file_copy_dir")
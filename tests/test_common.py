@@ -118,5 +118,15 @@ class TestLogger(unittest.TestCase):
         self._run_logger_unicode_test(False)
 
 
+class TestIsKoboJs(unittest.TestCase):
+    def test_is_kobo_js(self):
+        for name in ("kobo.js", "js/kobo.js", "OEBPS/Kobo-Extra.JS", "kobo_123.js"):
+            self.assertTrue(common.is_kobo_js(name), name)
+
+    def test_is_not_kobo_js(self):
+        for name in ("script.js", "kobo.css", "kobo.js.bak", "js/kobo/style.css"):
+            self.assertFalse(common.is_kobo_js(name), name)
+
+
 if __name__ == "__main__":
     unittest.main(module="test_common", verbosity=2)